@@ -19,6 +19,7 @@ from dltlyse.core.utils import round_float
 # pylint: disable= unsupported-membership-test
 
 EXTRACT_DIR = "extracted_files"
+FILE_BUFFER_SIZE = 1024 * 1024  # Buffer size of the files written by plugins
 logger = logging.getLogger(__name__)
 
 
@@ -63,10 +64,35 @@ def plugin_metadata(**kwargs):
     return _metadata
 
 
-class Plugin(object):
-    """dltlyse Plugin base class"""
+@functools.lru_cache(maxsize=None)
+def _get_result_description(plugin_class):
+    """Return the test name and the metadata of the results of a plugin class
+
+    The docstring only depends on the class, so it is parsed once for all results of the plugin. The metadata
+    is a copy with the docstring added, add_result() copies it again for each result.
+    """
+    # Like inspect.getdoc() for an instance, the docstring is not inherited from a base class
+    doc = plugin_class.__doc__
+    plugin_docstring = inspect.cleandoc(doc) if isinstance(doc, str) else None
+
+    testname = plugin_docstring.splitlines()[0] if plugin_docstring else plugin_class.__name__
+    metadata = dict(getattr(plugin_class, "plugin_metadata", {}))
+    metadata["docstring"] = plugin_docstring or ""
+
+    return testname, metadata
+
+
+@functools.lru_cache(maxsize=None)
+def _get_report_filename(plugin_name):
+    """Return the report filename for a plugin name"""
+    # Converts all uppercase letters in lowercase, pre-pending them with a '_'.
+    report_filename = re.sub(r"([A-Z])", r"_\1", plugin_name)
 
-    __metaclass__ = ABCMeta
+    return report_filename.lower().strip("_") + ".txt"
+
+
+class Plugin(metaclass=ABCMeta):
+    """dltlyse Plugin base class"""
 
     # message filters are filters that will be used during loading DLT trace file. Each plugin defines
     # list of (APID, CTID) pairs and only messages matching those criteria are read from the DLT trace file.
@@ -79,6 +105,10 @@ class Plugin(object):
 
     manually_executed = False  # True if a plugin should be manually selected (not automatic execution).
 
+    # True if the states of the plugin from several analyser processes can be combined with merge(). The trace
+    # files are only analysed in parallel when all loaded plugins are mergeable.
+    mergeable = False
+
     def __init__(self):
         self.__results = []
         self.__exceptions = []
@@ -117,16 +147,10 @@ class Plugin(object):
         # Parse class name
         kwargs.setdefault("classname", self.get_plugin_name())
 
-        # Parse class docstring
-        plugin_docstring = inspect.getdoc(self)
-
-        # Parse plugin short description
-        kwargs.setdefault("testname", plugin_docstring.splitlines()[0] if plugin_docstring else type(self).__name__)
-
-        # Parse plugin metadata and add plugin docstring
-        metadata = copy.deepcopy(getattr(self, "plugin_metadata", {}))
-        metadata["docstring"] = plugin_docstring or ""
-        kwargs.setdefault("metadata", metadata)
+        # Parse plugin short description and metadata, with the plugin docstring added to the metadata
+        testname, metadata = _get_result_description(type(self))
+        kwargs.setdefault("testname", testname)
+        kwargs.setdefault("metadata", copy.deepcopy(metadata))
 
         self.__results.append(Result(**kwargs))
 
@@ -148,11 +172,12 @@ class Plugin(object):
 
     def report_exceptions(self):
         """Report all detected exceptions"""
-        logger.debug(
-            "Timings of plugin %s: %s",
-            self.get_plugin_name(),
-            {k: str(round_float(v, 2)) for k, v in self.__timings.items()},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Timings of plugin %s: %s",
+                self.get_plugin_name(),
+                {k: str(round_float(v, 2)) for k, v in self.__timings.items()},
+            )
         if self.__exceptions:
             self.add_result(
                 testname="Exceptions during execution",
@@ -167,6 +192,27 @@ class Plugin(object):
         """Return the results object"""
         return self.__results
 
+    def merge(self, other, lifecycle_offset=0):  # pylint: disable=unused-argument
+        """Merge the state of the same plugin from another analyser process
+
+        The results, exceptions and timings are merged by default. Plugins which collect data in __call__ or
+        in the lifecycle callbacks should extend the method to merge the data and set mergeable to True.
+
+        The lifecycles are split at trace-file boundaries: the other process counts the lifecycles of its trace
+        file from 0. When the trace file continues the last lifecycle of the previous file, the messages before its
+        first lifecycle start message belong to its lifecycle 0. With the offset added, that is the last lifecycle
+        id of the previous file again, so the lifecycle is started and ended by both processes.
+
+        :param Plugin other: The plugin object from the other process
+        :param int lifecycle_offset: The number of lifecycles before the trace file of the other process, which
+            has to be added to the lifecycle ids collected by the other plugin
+        """
+        self.__results.extend(other.get_results())
+        for message in other.__exceptions:  # pylint: disable=protected-access
+            self.add_exception(message)
+        for action, timing in other.__timings.items():  # pylint: disable=protected-access
+            self.add_timing(action, timing)
+
     def new_lifecycle(self, ecu_id, lifecycle_id):  # pylint: disable=no-self-use,unused-argument
         """Called at the start of each lifecycle (including first)"""
         pass
@@ -200,12 +246,11 @@ class CSVPlugin(Plugin):  # pylint: disable=abstract-method
 
     def _create_csvfile(self, filename=None):
         """Create csv file and add first row with column names"""
-        filename = filename or list(self.csv_filenames)[0]
+        filename = filename or next(iter(self.csv_filenames))
         pathname = os.path.join(EXTRACT_DIR, filename)
-        if not os.path.exists(os.path.dirname(pathname)):
-            os.makedirs(os.path.dirname(pathname))
+        os.makedirs(os.path.dirname(pathname), exist_ok=True)
 
-        self._csv_fileobj[filename] = open(pathname, "w")
+        self._csv_fileobj[filename] = open(pathname, "w", buffering=FILE_BUFFER_SIZE, newline="")
         self._csv[filename] = csv.writer(self._csv_fileobj[filename])
         if self.csv_filenames[filename]:  # Only write header line if columns are defined.
             self._csv[filename].writerow(self.csv_filenames[filename])
@@ -214,14 +259,14 @@ class CSVPlugin(Plugin):  # pylint: disable=abstract-method
 
     def writerow(self, data_row, filename=None):
         """Write a row to CSV file"""
-        filename = filename or list(self.csv_filenames)[0]
+        filename = filename or next(iter(self.csv_filenames))
         if filename not in self._csv:
             self._create_csvfile(filename)
         self._csv[filename].writerow(data_row)
 
     def writerows(self, data_rows, filename=None):
         """Write several rows to csv file"""
-        filename = filename or list(self.csv_filenames)[0]
+        filename = filename or next(iter(self.csv_filenames))
         if filename not in self._csv:
             self._create_csvfile(filename)
         self._csv[filename].writerows(data_rows)
@@ -233,7 +278,7 @@ class CSVPlugin(Plugin):  # pylint: disable=abstract-method
 
     def _close_csv_file(self, filename=None):
         """Close CSV file"""
-        filename = filename or list(self.csv_filenames)[0]
+        filename = filename or next(iter(self.csv_filenames))
         if self._csv[filename]:
             self._csv_fileobj[filename].close()
 
@@ -335,7 +380,10 @@ class CallBacksAndReportPlugin(Plugin):  # pylint: disable=abstract-method
         """
         self.dlt_callbacks = defaultdict(list)
         self.dlt_greedy_callbacks = []
-        for member_name in dir(self):  # Scans the class members.
+        # Callbacks can also be set on the instance, so they are looked up next to the cached class ones.
+        member_names = set(self.get_callback_names())
+        member_names.update(name for name, value in vars(self).items() if getattr(value, "filter_condition", None))
+        for member_name in sorted(member_names):
             member = getattr(self, member_name)
             filter_condition = getattr(member, "filter_condition", None)
             if filter_condition:
@@ -347,6 +395,26 @@ class CallBacksAndReportPlugin(Plugin):  # pylint: disable=abstract-method
                     self.message_filters = "all"
                     self.dlt_greedy_callbacks.append(member)
 
+    @classmethod
+    def get_callback_names(cls):
+        """Returns the names of the dlt callbacks defined in the class and its bases.
+
+        The names are collected once per class and cached in the class itself.
+        """
+        callback_names = cls.__dict__.get("_dlt_callback_names")  # Not inherited from a base class.
+        if callback_names is None:
+            seen_names = set()
+            callback_names = []
+            for klass in cls.__mro__:
+                for name, value in vars(klass).items():
+                    if name in seen_names:  # Overridden in a subclass.
+                        continue
+                    seen_names.add(name)
+                    if getattr(getattr(value, "__func__", value), "filter_condition", None):
+                        callback_names.append(name)
+            cls._dlt_callback_names = callback_names
+        return callback_names
+
     # pylint: disable=invalid-name
     def add_callback_from_template_function(self, template_function, app_id, ctx_id, userdata):
         """Adds an additional callback which is automatically generated from a "template" function or method.
@@ -386,10 +454,7 @@ class CallBacksAndReportPlugin(Plugin):  # pylint: disable=abstract-method
 
     def report_filename(self):
         """Builds & returns a standard/base filename for the report."""
-        # Converts all uppercase letters in lowercase, pre-pending them with a '_'.
-        report_filename = re.sub(r"([A-Z])", r"_\1", self.get_plugin_name())
-
-        return report_filename.lower().strip("_") + ".txt"
+        return _get_report_filename(self.get_plugin_name())
 
     def prepare_report(self):
         """It's invoked just before writing the report to file, in case that some operation needs
@@ -429,7 +494,8 @@ class CallBacksAndReportPlugin(Plugin):  # pylint: disable=abstract-method
 
         The callbacks were registered with the dlt_callbacks decorator.
         """
-        for callback in self.dlt_callbacks[message.apid, message.ctid]:  # pylint: disable=no-member
+        # get() doesn't add an empty entry to the defaultdict for every unmatched message
+        for callback in self.dlt_callbacks.get((message.apid, message.ctid), ()):  # pylint: disable=no-member
             callback(message)
         for callback in self.dlt_greedy_callbacks:  # pylint: disable=no-member
             callback(message)
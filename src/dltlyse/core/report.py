@@ -27,6 +27,8 @@ class Metadata(object):
     The class is internally used for `class Result`. Normally you should not use the class directly.
     """
 
+    __slots__ = ("metadata",)
+
     def __init__(self, metadata=None):
         self.metadata = metadata or {}
 
@@ -36,12 +38,16 @@ class Metadata(object):
         If parses self.metadata and transforms it to a xml element. If the type of value is a dict, it parses it
         recursively. Otherwise, it will convert the value with `str()`
         """
-        for key, value in sorted(metadata.items(), key=lambda keyvalue: keyvalue[0]):
-            item = etree.SubElement(node, "item", name=key)
-            if isinstance(value, dict):
-                self._render_xml(item, value)
-            else:
-                item.text = str(value)
+        stack = [(node, metadata)]
+        while stack:
+            parent, parent_metadata = stack.pop()
+            for key in sorted(parent_metadata):
+                value = parent_metadata[key]
+                item = etree.SubElement(parent, "item", name=key)
+                if isinstance(value, dict):
+                    stack.append((item, value))
+                else:
+                    item.text = str(value)
 
     def render_xml(self):
         """Return a xml element to present metadata
@@ -60,6 +66,8 @@ class Metadata(object):
 class Result(object):
     """Class representing a single testcase result"""
 
+    __slots__ = ("classname", "testname", "state", "stdout", "stderr", "message", "attach", "metadata", "timestamp")
+
     def __init__(
         self,
         classname="Unknown",
@@ -86,16 +94,10 @@ class Result(object):
         self.timestamp = str(dt.datetime.now(dt.timezone.utc)) if timestamp is None else str(timestamp)
 
     def __repr__(self):
-        return repr(self.__dict__)
+        return repr({name: getattr(self, name) for name in self.__slots__})
 
     def __eq__(self, other):
-        self_dict = self.__dict__.copy()
-        del self_dict["metadata"]
-
-        other_dict = other.__dict__.copy()
-        del other_dict["metadata"]
-
-        return self_dict == other_dict
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__ if name != "metadata")
 
     def render_xml(self):
         """Return a xml element to present test result"""
@@ -109,7 +111,7 @@ class Result(object):
         )
 
         # Set attachment
-        root.text = "".join(ATTACHMENT_TEMPLATE.format(filename=filename) for filename in self.attach)
+        root.text = "".join([ATTACHMENT_TEMPLATE.format(filename=filename) for filename in self.attach])
 
         # If the result is not success, output state and error message
         if self.state != "success":
@@ -156,8 +158,8 @@ class XUnitReport(object):
             "number_of_tests": str(len(self.results)),
         }
 
-    def render_xml(self):
-        """Return a xml element to present report"""
+    def _render_testsuite_xml(self):
+        """Return a xml element to present the testsuite without the test cases"""
         summary = self._generate_summary()
         root_attributes = {
             "name": self.testsuite_name,
@@ -179,26 +181,42 @@ class XUnitReport(object):
         if self.software and isinstance(self.software, dict):
             etree.SubElement(root, "software", self.software)
 
-        result_elements = []
+        return root
+
+    def _render_results_xml(self):
+        """Yield a xml element for every result which can be rendered"""
         for result in self.results:
             try:
-                element = result.render_xml()
-                result_elements.append(element)
+                yield result.render_xml()
             except Exception as err:  # pylint: disable=broad-except
                 logger.error("Render result error: %s - %s", result, err)
 
-        root.extend(result_elements)
+    def render_xml(self):
+        """Return a xml element to present report"""
+        root = self._render_testsuite_xml()
+        root.extend(self._render_results_xml())
 
         return root
 
     def render(self):
-        """Renders a XUnit report to file"""
+        """Renders a XUnit report to file
+
+        The test cases are written one by one, so only a single one is kept in memory.
+        """
         if not self.outfile:
             return
 
-        # Generate the xml element tree
-        tree = etree.ElementTree(self.render_xml())
+        # Split the serialized testsuite element around the place of the test cases
+        testsuite = etree.tostring(self._render_testsuite_xml(), encoding="unicode")
+        end_tag = "</testsuite>"
+        if testsuite.endswith(end_tag):
+            testsuite = testsuite[: -len(end_tag)]
+        else:  # Serialized as an empty element
+            testsuite = testsuite[: -len(" />")] + ">"
 
         # Write to file
         with open(self.outfile, "wb") as report_file:
-            tree.write(report_file, encoding="UTF-8", xml_declaration=True, method="xml")
+            report_file.write("<?xml version='1.0' encoding='UTF-8'?>\n{}".format(testsuite).encode("UTF-8"))
+            for element in self._render_results_xml():
+                etree.ElementTree(element).write(report_file, encoding="UTF-8", xml_declaration=False, method="xml")
+            report_file.write(end_tag.encode("UTF-8"))
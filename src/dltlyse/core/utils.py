@@ -2,6 +2,7 @@
 """Helper functions"""
 
 import atexit
+import functools
 import logging
 import os
 import tempfile
@@ -176,8 +177,31 @@ def data_to_xml_tree(data, parent=None, child_tag=None, child_attrib=None):
         child_tag(str, None): the tag to be used for direct children (if any).
         child_attrib(dict, None): the attributes to to be used for direct children (if any).
     """
+    # The children are converted with an explicit stack instead of recursive calls, so deeply nested data
+    # doesn't cost a Python frame per node and can't hit the recursion limit. The children of a node are
+    # pushed in reverse order, so sibling nodes are still created in the order of the data.
+    root, children, child_tag, child_attrib = _data_to_xml_node(data, parent, child_tag, child_attrib)
+    pending = [(root, child, child_tag, child_attrib) for child in reversed(children)]
+    while pending:
+        parent, data, child_tag, child_attrib = pending.pop()
+        node, children, child_tag, child_attrib = _data_to_xml_node(data, parent, child_tag, child_attrib)
+        pending.extend((node, child, child_tag, child_attrib) for child in reversed(children))
+
+    return root
+
+
+def _data_to_xml_node(data, parent, child_tag, child_attrib):
+    """Converts a single level of a Python structure in an ElementTree element, see data_to_xml_tree.
+
+    Returns the new element, its children data still to be converted, and the tag and attributes
+    to be used for these children.
+    """
     # print('data_to_xml_tree: data={}, parent={}, child_tag={}, child_attrib={}'.format(
     #     data, parent, child_tag, child_attrib), file=out)
+    if not child_tag and child_attrib is None and isinstance(data, str):  # Only the tag: the most common leaf.
+        node = Element(data) if parent is None else SubElement(parent, data)
+        return node, (), child_tag, child_attrib
+
     attrib, value = {}, None
     if child_tag:  # Have: tag. Miss: attrib, value
         tag, child_tag = child_tag, None
@@ -234,10 +258,8 @@ def data_to_xml_tree(data, parent=None, child_tag=None, child_attrib=None):
     node = Element(tag, attrib) if parent is None else SubElement(parent, tag, attrib)
     if text is not None:
         node.text = text
-    for child in children:
-        data_to_xml_tree(child, node, child_tag, child_attrib)
 
-    return node
+    return node, children, child_tag, child_attrib
 
 
 def data_to_xml_string(data, prettify=True, indent="\t", newline="\n"):
@@ -265,20 +287,11 @@ def create_temp_dlt_file(stream=None, dlt_message=None, empty=False):
         dlt_message(DLTMessage object): A dlt message object to be converted into temporary file
         empty(bool): True will just create an empty DLT file
     """
-    _, tmpname = tempfile.mkstemp()
-    if empty:
-        return tmpname
-    msg = ()
-    if dlt_message:
-        msg = dlt_message.to_bytes()
-    else:
-        msg = stream
-
-    tmpfile = open(tmpname, "wb")
-    tmpfile.write(msg)
-    tmpfile.flush()
-    tmpfile.seek(0)
-    tmpfile.close()
+    # Write through the descriptor of mkstemp instead of opening the file again by its name
+    tmpfd, tmpname = tempfile.mkstemp()
+    with os.fdopen(tmpfd, "wb") as tmpfile:
+        if not empty:
+            tmpfile.write(dlt_message.to_bytes() if dlt_message else stream)
 
     atexit.register(os.remove, tmpname)
 
@@ -293,6 +306,12 @@ def round_float(val, precision=4):
         val(float): The value that needs to be rounded off
         precision(int): Number of decimal places to round off
     """
-    decimal_points = Decimal(10) ** -(precision)
-    result_val = Decimal(val).quantize(decimal_points)
-    return result_val if result_val.normalize() == result_val.to_integral() else result_val.normalize()
+    result_val = Decimal(val).quantize(_decimal_quantum(precision))
+    normalized_val = result_val.normalize()
+    return result_val if normalized_val == result_val.to_integral() else normalized_val
+
+
+@functools.lru_cache(maxsize=None)
+def _decimal_quantum(precision):
+    """Returns the Decimal with the given number of decimal places to quantize a value with"""
+    return Decimal(10) ** -(precision)
@@ -17,7 +17,8 @@ class MockDLTMessage(object):
 
     def compare(self, target):
         """Compare DLT Message to a dictionary"""
-        return target == {k: v for k, v in self.__dict__.items() if k in target.keys()}
+        attributes = self.__dict__
+        return all(key in attributes and attributes[key] == value for key, value in target.items())
 
     @property
     def payload_decoded(self):
@@ -8,12 +8,18 @@ class ContextPlugin(Plugin):
     """Count DLTD INTM messages"""
 
     message_filters = [("DLTD", "INTM")]
+    mergeable = True
 
     matched_messages = 0
 
     def __call__(self, message):
-        if message.apid == "DLTD" and message.ctid == "INTM":
-            self.matched_messages += 1
+        # The analyser only dispatches messages matching message_filters to the plugin
+        self.matched_messages += 1
+
+    def merge(self, other, lifecycle_offset=0):
+        """Add the messages counted by another analyser process"""
+        self.matched_messages += other.matched_messages
+        super(ContextPlugin, self).merge(other, lifecycle_offset)
 
     def report(self):
         if self.matched_messages > 0:
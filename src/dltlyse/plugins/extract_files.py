@@ -10,8 +10,7 @@ import logging
 import os
 from typing import Dict
 
-from collections import OrderedDict
-from dltlyse.core.plugin_base import Plugin, EXTRACT_DIR
+from dltlyse.core.plugin_base import Plugin, EXTRACT_DIR, FILE_BUFFER_SIZE
 
 COREDUMP_DIR = "Coredumps"
 FULL_EXTRACT_DIR = os.path.join(EXTRACT_DIR, COREDUMP_DIR)
@@ -29,16 +28,16 @@ class File(object):
         self.error = False
         self.finished = False
         # store the temporary (part) file in the extracted_files/Coredumps/${transfer_id}/${filename}.part
-        self._part_filepath = os.path.join(FULL_EXTRACT_DIR, self.transfer_id, self.filename + ".part")
+        self._transfer_dir = os.path.join(FULL_EXTRACT_DIR, self.transfer_id)
+        self._part_filepath = os.path.join(self._transfer_dir, self.filename + ".part")
 
         # warn if the file has been already extracted before (not finished extraction)
         if os.path.exists(self._part_filepath):
             logger.warning("File '%s' exists already!", self._part_filepath)
         # make sure the extracted_files/Coredumps/${transfer_id} directory exists
-        if not os.path.exists(os.path.join(FULL_EXTRACT_DIR, self.transfer_id)):
-            os.makedirs(os.path.join(FULL_EXTRACT_DIR, self.transfer_id))
+        os.makedirs(self._transfer_dir, exist_ok=True)
 
-        self.handle = open(self._part_filepath, "wb")
+        self.handle = open(self._part_filepath, "wb", buffering=FILE_BUFFER_SIZE)
 
     def close(self):
         """Close the handle and rename file to be completed"""
@@ -50,11 +49,11 @@ class File(object):
             if not os.path.exists(final_name):
                 os.rename(self._part_filepath, final_name)
                 try:
-                    os.rmdir(os.path.dirname(self._part_filepath))
+                    os.rmdir(self._transfer_dir)
                 except OSError:
                     pass
             else:
-                os.rename(self._part_filepath, os.path.join(os.path.dirname(self._part_filepath), self.filename))
+                os.rename(self._part_filepath, os.path.join(self._transfer_dir, self.filename))
 
     def __repr__(self):
         return self.filename
@@ -65,13 +64,15 @@ class ExtractFilesPlugin(Plugin):
 
     message_filters = [("SYS", "FILE"), ("FLT", "FILE")]
 
-    extracted_files: Dict[str, str] = {}
-    success = False
-
-    counter = 0
+    def __init__(self):
+        # the state is kept per instance, so loading the plugin again doesn't see the files of a previous run
+        self.extracted_files: Dict[str, File] = {}
+        self.success = False
+        self.counter = 0
+        super(ExtractFilesPlugin, self).__init__()
 
     def __call__(self, message):
-        if message.apid in ["SYS", "FLT"] and message.ctid == "FILE":
+        if message.apid in ("SYS", "FLT") and message.ctid == "FILE":
             # file transfer payload header
             #  FLST - file trasfer start - first DLT message from the file transfer
             #          ["FLST", transfer_id, filename, length, date, "FLST"]
@@ -79,56 +80,61 @@ class ExtractFilesPlugin(Plugin):
             #          ["FLDA", transfer_id, index, data, "FLDA"]
             #  FLFI - file transfer end
             #          ["FLFI", transfer_id, "FLFI"]
-            payload_header = message.payload[0].decode("utf8")
-            transfer_id = str(message.payload[1])  # used as a dictionary key
-            if payload_header == "FLST":
-                filename = message.payload[2].decode("utf8")
-                filename = os.path.basename(filename)  # ignore whatever path is included in DLT
-                logger.info("Found file '%s' in the trace", filename)
-                extr_file = File(transfer_id=transfer_id, filename=filename)
-                self.extracted_files[transfer_id] = extr_file
-            elif payload_header == "FLDA":
+            # The payload is parsed only once and the raw header is compared without decoding it, because every
+            # message of a file transfer passes here and FLDA messages are the bulk of them.
+            payload = message.payload
+            payload_header = payload[0]
+            transfer_id = str(payload[1])  # used as a dictionary key
+            if payload_header == b"FLDA":
                 extr_file = self.extracted_files[transfer_id]
                 extr_file.index += 1
-                if extr_file.index != message.payload[2]:
+                if extr_file.index != payload[2]:
                     if not extr_file.error:
                         logger.error(
                             "Expected index %d, got %d, failing file %s",
                             extr_file.index,
-                            message.payload[2],
+                            payload[2],
                             extr_file.filename,
                         )
                     extr_file.error = True
-                extr_file.handle.write(message.payload[3])
-            elif payload_header == "FLFI":
+                extr_file.handle.write(payload[3])
+            elif payload_header == b"FLST":
+                filename = payload[2].decode("utf8")
+                filename = os.path.basename(filename)  # ignore whatever path is included in DLT
+                logger.info("Found file '%s' in the trace", filename)
+                extr_file = File(transfer_id=transfer_id, filename=filename)
+                self.extracted_files[transfer_id] = extr_file
+            elif payload_header == b"FLFI":
                 extr_file = self.extracted_files[transfer_id]
                 extr_file.finished = True
                 extr_file.close()
 
     def report(self):
         bad_files = []
-        text = "extracted files found:\n"
-        sorted_extracted_files = OrderedDict(sorted(self.extracted_files.items()))
-        successful_attachments = [
-            os.path.join(COREDUMP_DIR, x.filename)
-            for x in sorted_extracted_files.values()
-            if not x.error and x.finished
-        ]
-
-        for extr_file in sorted_extracted_files.values():
-            text += " - {}".format(extr_file.filename)
+        report_lines = ["extracted files found:\n"]
+        sorted_extracted_files = [extr_file for _, extr_file in sorted(self.extracted_files.items())]
+        successful_filenames = set()
+        successful_attachments = []
+        for extr_file in sorted_extracted_files:
+            if not extr_file.error and extr_file.finished:
+                successful_filenames.add(extr_file.filename)
+                successful_attachments.append(os.path.join(COREDUMP_DIR, extr_file.filename))
+
+        for extr_file in sorted_extracted_files:
+            report_lines.append(" - {}".format(extr_file.filename))
             if extr_file.error:
                 bad_files.append(extr_file.filename)
-                text += " ERROR: File parts missing!"
+                report_lines.append(" ERROR: File parts missing!")
             if extr_file.finished is False:
-                if os.path.join(COREDUMP_DIR, extr_file.filename) in successful_attachments:
+                if extr_file.filename in successful_filenames:
                     # another file transfer of the same file succeeded
                     logger.warning("File '%s' is not complete", extr_file.filename)
                 else:  # file hasn't been re-transferred - error
                     bad_files.append(extr_file.filename)
                     logger.error("File '%s' is not complete", extr_file.filename)
-                    text += " ERROR: File not complete!"
-            text += "\n"
+                    report_lines.append(" ERROR: File not complete!")
+            report_lines.append("\n")
+        text = "".join(report_lines)
 
         if bad_files:
             self.add_result(
@@ -14,12 +14,15 @@ class TestSysErrorPlugin(Plugin):
     # relevant APIDs and CTIDs to filter for
     #  - SYS|JOUR: error detection
     message_filters = [("SYS", "JOUR")]
+    mergeable = True
     shared_regex = re.compile(
         r"\[[0-9]*\]: (?P<program>\S*?): error while loading shared libraries: "
-        r"(?P<librabry>\S*?): cannot open shared object file"
+        r"(?P<library>\S*?): cannot open shared object file"
     )
 
-    errors: DefaultDict[str, Set[str]] = collections.defaultdict(set)
+    def __init__(self):
+        self.errors: DefaultDict[str, Set[str]] = collections.defaultdict(set)
+        super(TestSysErrorPlugin, self).__init__()
 
     def __call__(self, message):
         """Handle traces"""
@@ -27,12 +30,22 @@ class TestSysErrorPlugin(Plugin):
             return
 
         payload_decoded = str(message.payload_decoded)
+        # Nearly no message reports an error, a substring search skips them much faster than the regex
+        if "error while loading shared libraries" not in payload_decoded:
+            return
+
         match = self.shared_regex.search(payload_decoded)
         if match:
             self.errors["error while loading shared libraries"].add(
-                "{} faild to load {}".format(match.group("program"), match.group("librabry"))
+                "{} faild to load {}".format(match.group("program"), match.group("library"))
             )
 
+    def merge(self, other, lifecycle_offset=0):
+        """Merge the errors found by another analyser process"""
+        for error, details in other.errors.items():
+            self.errors[error].update(details)
+        super(TestSysErrorPlugin, self).merge(other, lifecycle_offset)
+
     def report(self):
         """Report if errors were found"""
 
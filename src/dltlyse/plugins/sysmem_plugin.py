@@ -1,8 +1,12 @@
 # Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
 """Parses DLT messages from the Monitor tool to gather system RAM usage"""
-from csv import writer
+import re
+from typing import Any, Dict, List  # noqa: F401
 
-from dltlyse.core.plugin_base import Plugin
+from dltlyse.core.plugin_base import Plugin, FILE_BUFFER_SIZE
+
+# Matches the "<field>: <value>MB" entries of the memory statistics that are reported
+FIELD_RE = re.compile(r"\b(MemTotal|MemAvailable|Buffers|Cached|Shmem)\s*:\s*([0-9.]+)")
 
 
 class SysmemPlugin(Plugin):
@@ -12,6 +16,8 @@ class SysmemPlugin(Plugin):
 
     pathname = "sysmem_report.csv"
     lifecycle_csv_fields = ("lifecycle", "time", "mem_total", "mem_available", "buffers", "cached", "shared")
+    # The values are numbers only, so the rows are formatted without the csv module, with its line terminator
+    row_format = ",".join(["{}"] * len(lifecycle_csv_fields)) + "\r\n"
 
     field_mapping = {
         "MemTotal": "mem_total",
@@ -23,33 +29,32 @@ class SysmemPlugin(Plugin):
 
     def __init__(self):
         self.csv_fileobj = None
-        self.csv = None
         self.lifecycle = None
+        self.lifecycle_str = ""
         self.min_mem_available = None
+        # Position of each reported statistic in a CSV row
+        self.row_index = {
+            field: self.lifecycle_csv_fields.index(name) for field, name in self.field_mapping.items()
+        }  # type: Dict[str, int]
         super(SysmemPlugin, self).__init__()
 
     def new_lifecycle(self, ecu_id, lifecycle_id):
         """New device start"""
-        if not self.csv:  # Only create the report file if this plugin is actually run
-            self.csv_fileobj = open(self.pathname, "w")
-            self.csv = writer(self.csv_fileobj)
-            self.csv.writerow(self.lifecycle_csv_fields)
+        if not self.csv_fileobj:  # Only create the report file if this plugin is actually run
+            self.csv_fileobj = open(self.pathname, "w", buffering=FILE_BUFFER_SIZE, newline="")
+            self.csv_fileobj.write(self.row_format.format(*self.lifecycle_csv_fields))
         self.lifecycle = lifecycle_id
+        self.lifecycle_str = str(lifecycle_id)
         super(SysmemPlugin, self).new_lifecycle(ecu_id, lifecycle_id)
 
     def __call__(self, message):
-        data = {"lifecycle": str(self.lifecycle), "time": message.tmsp}
-        for combo_value in message.payload_decoded.split("MB"):
-            if ":" not in combo_value:
-                continue
-            field, value = combo_value.split(":")
-            field = field.strip()
+        row = [self.lifecycle_str, message.tmsp, "", "", "", "", ""]  # type: List[Any]
+        for field, value in FIELD_RE.findall(message.payload_decoded):
             value = int(float(value) * 1024)
             if field == "MemAvailable":
                 self.min_mem_available = min(value, self.min_mem_available) if self.min_mem_available else value
-            if field in self.field_mapping:
-                data[self.field_mapping[field]] = value
-        self.csv.writerow([str(data.get(k, "")) for k in self.lifecycle_csv_fields])
+            row[self.row_index[field]] = value
+        self.csv_fileobj.write(self.row_format.format(*row))
 
     def end_lifecycle(self, ecu_id, lifecycle_id):
         """Device shut down"""
@@ -58,7 +63,6 @@ class SysmemPlugin(Plugin):
 
     def report(self):
         """Close report files and attach them to a test result"""
-        self.csv.close()
         self.csv_fileobj.close()
         if self.min_mem_available < 1024 * 1024:
             self.add_result(message="Available memory dropped below 1Gb", state="failure")
@@ -2,9 +2,7 @@
 # Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
 """DLT file analyser"""
 
-import configparser
 import argparse
-import fnmatch
 import logging
 import os
 import sys
@@ -28,6 +26,9 @@ def parse_options(args=sys.argv[1:]):
     if args.config_file:
         if not os.path.exists(args.config_file):
             raise IOError("Configuration file '{}' could not be found.".format(args.config_file))
+        # configparser is only imported when a config file is given, it isn't needed by most runs
+        import configparser  # pylint: disable=import-outside-toplevel
+
         config = configparser.ConfigParser()
         config.read([args.config_file])
         defaults = dict(config.items("default"))
@@ -109,11 +110,54 @@ def parse_options(args=sys.argv[1:]):
         default=False,
         help="Do a live run of DLTlyse plugins on incoming DLT logs",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="Analyse up to JOBS trace files in parallel processes. It is ignored with a warning for a live run, "
+        "a single trace file or plugins which are not mergeable",
+    )
     parser.add_argument("traces", nargs="*", help="DLT trace files")
 
     return parser.parse_args(remaining_args)
 
 
+def find_traces(directory, recursive=False):
+    """Find the DLT trace files in a directory
+
+    os.scandir gets the type of each entry from the directory listing, so no entry needs a stat call.
+    Like os.walk, symlinks to directories are not followed and unreadable subdirectories are skipped
+    in a recursive search.
+
+    Args:
+        directory(str): the directory to search.
+        recursive(bool): True if the subdirectories should be searched as well.
+
+    Returns:
+        list: the paths of the trace files, sorted.
+    """
+    traces = []
+    pending_dirs = [directory]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if recursive and not entry.is_symlink():
+                            pending_dirs.append(entry.path)
+                    elif entry.name.endswith(".dlt"):
+                        traces.append(entry.path)
+        except OSError:
+            if current_dir == directory:
+                raise
+            logger.warning("Could not search directory '%s' for traces", current_dir)
+
+    return sorted(traces)
+
+
 def main():
     """Entry point"""
     logging.basicConfig(level=logging.INFO)
@@ -140,15 +184,7 @@ def main():
     traces = []
     for trace in options.traces:
         if os.path.isdir(trace):
-            dir_traces = []
-            if options.recursive_search is True:
-                for root, _, filenames in os.walk(trace):
-                    for filename in fnmatch.filter(filenames, "*.dlt"):
-                        dir_traces.append(os.path.join(root, filename))
-            else:
-                for filename in fnmatch.filter(os.listdir(trace), "*.dlt"):
-                    dir_traces.append(os.path.join(trace, filename))
-            traces.extend(sorted(dir_traces))
+            traces.extend(find_traces(trace, recursive=options.recursive_search))
         else:
             traces.append(trace)
 
@@ -158,6 +194,7 @@ def main():
         no_sort=True,
         is_live=options.live_run,
         testsuite_name=options.xunit_testsuite_name,
+        jobs=options.jobs,
     )
 
 
@@ -1,18 +1,28 @@
 # Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
 """Tests for core analyser parts of dltlyse."""
 from contextlib import contextmanager
+import concurrent.futures
+import logging
 import os
 import signal
+import sys
 import threading
-import time
 from typing import List, Tuple, Union  # noqa: F401
-from unittest.mock import ANY, call, MagicMock, patch
+from unittest.mock import ANY, call, DEFAULT, MagicMock, patch
 
 import pytest
 
 from dlt.dlt import cDLT_FILE_NOT_OPEN_ERROR, DLT_EMPTY_FILE_ERROR, DLTMessage  # noqa: F401
 from dlt.core import API_VER as DLT_VERSION_STR
-from dltlyse.core.analyser import DLTAnalyser, DLTLifecycle, DltlysePluginCollector
+from dltlyse.core.analyser import (
+    DLTAnalyser,
+    DLTLifecycle,
+    DltlysePluginCollector,
+    _scan_folder,
+    get_plugin_classes,
+    make_plugin_exception_message,
+)
+from dltlyse.core.plugin_base import Plugin
 from dltlyse.core.utils import (
     create_temp_dlt_file,
     dlt_example_stream,
@@ -21,6 +31,7 @@ from dltlyse.core.utils import (
     start_dlt_message,
 )
 from dltlyse.mock_dlt_message import MockDLTMessage
+from dltlyse.plugins.context import ContextPlugin
 
 
 try:
@@ -42,24 +53,18 @@ def fake_analyser():
 @contextmanager
 def fake_analyser_with_run_analyse_mock(dlt_msgs, plugin=None):
     """Helper function to mock internal functions for DLTAnalyser.run_analyse"""
-    cls_name = "dltlyse.core.analyser.DLTAnalyser"
-
-    with patch("{}.get_filters".format(cls_name)), patch("signal.signal"), patch(
-        "dltlyse.core.analyser.dlt.load", return_value=dlt_msgs
-    ), patch("{}.process_buffer".format(cls_name)) as mock_process_buffer, patch(
-        "{}.generate_reports".format(cls_name)
-    ), patch(
-        "{}.setup_lifecycle".format(cls_name), return_value=DLTLifecycle("MGHS", 1)
-    ) as mock_setup_lifecycle, patch(
-        "{}.end_lifecycle".format(cls_name)
-    ) as mock_end_lifecycle:
+    with patch.multiple(
+        DLTAnalyser,
+        get_filters=DEFAULT,
+        process_buffer=DEFAULT,
+        generate_reports=DEFAULT,
+        setup_lifecycle=DEFAULT,
+        end_lifecycle=DEFAULT,
+    ) as mocks, patch("signal.signal"), patch(
+        "dltlyse.core.analyser.dlt.load", side_effect=lambda *args, **kwargs: iter(dlt_msgs)
+    ):
+        mocks["setup_lifecycle"].return_value = DLTLifecycle("MGHS", 1)
         with fake_analyser() as analyser:
-            mocks = {
-                "end_lifecycle": mock_end_lifecycle,
-                "process_buffer": mock_process_buffer,
-                "setup_lifecycle": mock_setup_lifecycle,
-            }
-
             if plugin:
                 analyser.plugin_collector.msg_plugins = {("APID", "CTID"): (plugin,)}
                 analyser.plugin_collector.apid_plugins = {"APID": (plugin,)}
@@ -94,6 +99,47 @@ class FakePluginException(FakePlugin):
         raise Exception("Fake exception")
 
 
+class FakeEventPlugin(FakePlugin):
+    """Fake plugin which sets an event once it was called for the given number of messages, only for testing purpose"""
+
+    def __init__(self, plugin_name, message_filters, msg_count):
+        # type: (str, Union[str, List[Tuple[str, str]]], int) -> None
+        super(FakeEventPlugin, self).__init__(plugin_name, message_filters)
+        self.msg_count = msg_count
+        self.msgs_consumed = threading.Event()
+
+    def __call__(self, msg):  # type: (DLTMessage) -> None
+        super(FakeEventPlugin, self).__call__(msg)
+        if self.call_count == self.msg_count:
+            self.msgs_consumed.set()
+
+
+class FakeReportPlugin(Plugin):
+    """Fake plugin which reports results with the given states, only for testing purpose"""
+
+    def __init__(self, states):  # type: (List[str]) -> None
+        super(FakeReportPlugin, self).__init__()
+        self.states = states
+
+    def __call__(self, msg):  # type: (DLTMessage) -> None
+        pass
+
+    def report(self):  # type: () -> None
+        for state in self.states:
+            self.add_result(state=state, message="{} message".format(state))
+
+
+class DecodeCountingDLTMessage(MockDLTMessage):
+    """Mock DLT message which counts how often the payload is decoded"""
+
+    decode_count = 0
+
+    @property
+    def payload_decoded(self):
+        self.decode_count += 1
+        return self.payload
+
+
 def test_load_plugins():
     """Test plugin loading"""
     obj = DLTAnalyser()
@@ -146,33 +192,46 @@ def test_corrupt_msg_live():
     """Simulate test run of the dltlyse live with corrupt message"""
 
     def send_stop_signal(pid):
-        """Send a stop signal to the live run"""
-        time.sleep(0.1)
+        """Send a stop signal to the live run once all messages were consumed"""
+        plugin.msgs_consumed.wait(timeout=5.0)
         os.kill(pid, signal.SIGINT)
 
+    random_msgs = []
+    for i in range(60):
+        if i % 25 == 0:
+            random_msgs.append(single_random_corrupt_dlt_message)
+        elif i % 15 == 0:
+            random_msgs.append(start_dlt_message)
+        else:
+            random_msgs.append(single_random_dlt_message)
+
+    # Only the corrupt messages don't reach the plugin, so the last message of the file was consumed once the
+    # plugin was called for all other messages
+    msg_count = len(random_msgs) - random_msgs.count(single_random_corrupt_dlt_message)
+    plugin = FakeEventPlugin("fake_plugin", "all", msg_count)
+
     # Test with exactly MAX_BUFFER_SIZE MSGS and No Start
     obj = DLTAnalyser()
     obj.get_filters = MagicMock(return_value=[])
     obj.start_lifecycle = MagicMock()
     obj.end_lifecycle = MagicMock()
     obj.generate_reports = MagicMock()
+    obj.plugin_collector.init_plugins([plugin])
     xunit = MagicMock()
     stop_thread = threading.Thread(target=send_stop_signal, args=(os.getpid(),))
 
-    random_msgs = bytearray()
-    for i in range(60):
-        if i % 25 == 0:
-            random_msgs.extend(single_random_corrupt_dlt_message)
-        elif i % 15 == 0:
-            random_msgs.extend(start_dlt_message)
-        else:
-            random_msgs.extend(single_random_dlt_message)
-
-    file1 = create_temp_dlt_file(stream=random_msgs)
+    file1 = create_temp_dlt_file(stream=b"".join(random_msgs))
 
+    # The live run installs its own SIGINT handler, restore the one of pytest afterwards
+    sigint_handler = signal.getsignal(signal.SIGINT)
     stop_thread.start()
-    obj.run_analyse([file1], xunit, True, True)
+    try:
+        obj.run_analyse([file1], xunit, True, True)
+    finally:
+        stop_thread.join()
+        signal.signal(signal.SIGINT, sigint_handler)
 
+    assert plugin.call_count == msg_count
     assert obj.start_lifecycle.mock_calls == [
         call("MGHS", 0),
         call("MGHS", 1),
@@ -186,9 +245,103 @@ def test_corrupt_msg_live():
     assert obj.generate_reports.mock_calls == [call(xunit, "dltlyse")]
 
 
+def test_scan_folder_sys_path(tmp_path):
+    """Test to add a plugin folder to sys.path only once"""
+    with patch.object(sys, "path", list(sys.path)):
+        _scan_folder(str(tmp_path), [])
+        _scan_folder(str(tmp_path), [])
+
+        assert sys.path.count(str(tmp_path)) == 1
+
+
+def scan_fake_plugin(root, plugin_classes):  # type: (str, List[type]) -> bool
+    """Fake scan of a plugin folder which finds FakePlugin"""
+    plugin_classes.append(FakePlugin)
+    return True
+
+
+def test_get_plugin_classes_cache(tmp_path):
+    """Test to scan a plugin directory only once"""
+    with patch.dict("dltlyse.core.analyser._PLUGIN_CLASSES_CACHE", clear=True), patch(
+        "dltlyse.core.analyser._scan_folder", side_effect=scan_fake_plugin
+    ) as mock_scan:
+        assert get_plugin_classes([str(tmp_path)]) == [FakePlugin]
+        assert get_plugin_classes([str(tmp_path)]) == [FakePlugin]
+        assert mock_scan.call_count == 1
+
+
+def test_get_plugin_classes_cache_import_error(tmp_path):
+    """Test to scan a plugin directory again when some of its plugins could not be imported"""
+    with patch.dict("dltlyse.core.analyser._PLUGIN_CLASSES_CACHE", clear=True), patch(
+        "dltlyse.core.analyser._scan_folder", return_value=False
+    ) as mock_scan:
+        get_plugin_classes([str(tmp_path)])
+        get_plugin_classes([str(tmp_path)])
+
+        assert mock_scan.call_count == 2
+
+
+def test_scan_folder_import_error(tmp_path):
+    """Test to report an incomplete scan when a plugin module could not be imported"""
+    (tmp_path / "broken_plugin_module.py").write_text("import no_such_module_for_dltlyse\n")
+
+    with patch.object(sys, "path", list(sys.path)):
+        assert _scan_folder(str(tmp_path), []) is False
+
+
+@pytest.mark.parametrize(
+    "states,expected_output,expected_run_result",
+    [
+        (["success", "skipped"], "1 success 0 error 0 failure 1 skipped = passed.", 0),
+        (["success", "failure", "failure"], "1 success 0 error 2 failure 0 skipped = failed.", 1),
+        (["success", "unknown"], "1 success 0 error 0 failure 0 skipped = failed.", 1),
+    ],
+)
+def test_generate_reports(caplog, states, expected_output, expected_run_result):
+    """Test to summarize the result states of each plugin"""
+    with fake_analyser() as analyser, caplog.at_level("INFO", logger="summary"):
+        analyser.plugins = [FakeReportPlugin(states)]
+        analyser.traces = []
+
+        run_result = analyser.generate_reports("", "dltlyse")
+
+        assert "Report for FakeReportPlugin ... " + expected_output in caplog.messages
+        assert run_result == expected_run_result
+
+
+def test_generate_reports_error_report(caplog):
+    """Test to log the error report of a failed plugin as one record"""
+    with fake_analyser() as analyser, caplog.at_level("DEBUG", logger="summary"):
+        analyser.plugins = [FakeReportPlugin(["success", "failure", "error"])]
+        analyser.traces = []
+
+        analyser.generate_reports("", "dltlyse")
+
+        assert "- Error report for FakeReportPlugin:\nfailure message\n\nerror message\n" in caplog.messages
+
+
+def test_lifecycle_msgs():
+    """Test to get the first and last msg of a lifecycle"""
+    first_msg = MockDLTMessage(apid="APID", ctid="CTID")
+    last_msg = MockDLTMessage(apid="APID", ctid="CTID")
+    lifecycle = DLTLifecycle("MGHS", 1)
+
+    assert lifecycle.first_msg is None
+    with pytest.raises(ValueError):
+        lifecycle[0]  # pylint: disable=pointless-statement
+
+    lifecycle.set_first_msg(first_msg)
+    lifecycle.set_last_msg(last_msg)
+
+    assert lifecycle.first_msg is lifecycle[0] is first_msg
+    assert lifecycle.last_msg is lifecycle[-1] is last_msg
+    with pytest.raises(IndexError):
+        lifecycle[1]  # pylint: disable=pointless-statement
+
+
 def test_init_plugin_collector():
     """Test to init the plugin collector"""
-    with patch("dltlyse.core.analyser.DltlysePluginCollector.init_plugins") as mock_init:
+    with patch.object(DltlysePluginCollector, "init_plugins") as mock_init:
         with fake_analyser():
             mock_init.assert_called_once()
 
@@ -205,6 +358,13 @@ def test_init_plugin_collector():
             ],
             [("APID", "CTID"), ("APID1", "CTID1")],
         ),
+        (
+            [
+                FakePlugin("fake_plugin", [("APID", "CTID")]),
+                FakePlugin("fake_plugin", "all"),
+            ],
+            None,
+        ),
     ],
 )
 def test_check_get_filters(plugins, expected_filters):
@@ -229,7 +389,7 @@ def test_check_get_filters(plugins, expected_filters):
 def test_check_process_buffer(msg_buffer):
     """Check process buffer"""
 
-    with fake_analyser() as analyser, patch("dltlyse.core.analyser.DLTAnalyser.process_message") as mock_process:
+    with fake_analyser() as analyser, patch.object(DLTAnalyser, "process_message") as mock_process:
         analyser._buffered_traces = msg_buffer
 
         analyser.process_buffer()
@@ -238,6 +398,22 @@ def test_check_process_buffer(msg_buffer):
         assert not analyser._buffered_traces
 
 
+def test_process_message():
+    """Test to dispatch a buffered message to the plugins through the dispatch cache"""
+    plugin = FakePlugin("fake_plugin", None)
+
+    with fake_analyser() as analyser:
+        analyser.plugin_collector.msg_plugins = {("APID", "CTID"): (plugin,)}
+        analyser.plugin_collector.apid_plugins = {"APID": (plugin,)}
+        analyser.plugin_collector.ctid_plugins = {"CTID": (plugin,)}
+        analyser.plugin_collector.greedy_plugins = (plugin,)
+
+        analyser.process_message(MockDLTMessage(apid="APID", ctid="CTID"))
+
+        assert plugin.call_count == 4
+        assert analyser.plugin_collector.dispatch_cache[("APID", "CTID")] == (plugin,) * 4
+
+
 def test_run_analyse_init_lifecycle():
     """Test to init lifecycle without lifecycle start messages"""
     dlt_msgs = [
@@ -288,6 +464,23 @@ def test_run_analyse_call_plugin():
         assert plugin.call_count == 4
 
 
+def test_run_analyse_streaming():
+    """Test to dispatch every message before the next one is read from the trace"""
+    plugin = FakePlugin("fake_plugin", None)
+
+    def read_trace():
+        """Yield the messages of a trace, checking the calls of the previous ones"""
+        for index in range(10):
+            assert plugin.call_count == 4 * index
+            yield MockDLTMessage(apid="APID", ctid="CTID")
+
+    with fake_analyser_with_run_analyse_mock(read_trace(), plugin) as (analyser, _):
+        analyser.run_analyse(["/tmp/no-such-file"], MagicMock(), False, False)
+
+        assert plugin.call_count == 40
+        assert not analyser.file_exceptions
+
+
 def test_run_analyse_call_plugin_with_exception():
     """Test to handle plugin's exceptions"""
     plugin = FakePluginException("fake_plugin", None)
@@ -303,6 +496,64 @@ def test_run_analyse_call_plugin_with_exception():
             assert mock_exception.call_count == 4
 
 
+def test_make_plugin_exception_message_current_exception():
+    """Test to build the exception message from the exception which is currently handled"""
+    plugin = MagicMock()
+    plugin.get_plugin_name.return_value = "fake_plugin"
+
+    try:
+        raise ValueError("broken plugin")
+    except ValueError:
+        make_plugin_exception_message(plugin, "calling")
+
+    exception = plugin.add_exception.call_args[0][0]
+    assert exception.startswith("Error calling plugin fake_plugin - <class 'ValueError'>\n")
+    assert "ValueError: broken plugin" in exception
+
+
+def test_make_plugin_exception_message_plugin_class_not_logged():
+    """Test to skip formatting the traceback of a plugin class when errors are not logged"""
+    with patch("dltlyse.core.analyser.logger") as mock_logger, patch(
+        "dltlyse.core.analyser.traceback.format_exc"
+    ) as mock_format_exc:
+        mock_logger.isEnabledFor.return_value = False
+
+        try:
+            raise ValueError("broken plugin")
+        except ValueError:
+            make_plugin_exception_message(FakeReportPlugin, "loading")
+
+        mock_format_exc.assert_not_called()
+        mock_logger.error.assert_not_called()
+
+
+def test_run_analyse_lazy_payload_decoding():
+    """Test to decode the payload only for messages with a special (apid, ctid) pair"""
+    plugin = FakePlugin("fake_plugin", None)
+
+    dlt_msgs = [
+        DecodeCountingDLTMessage(apid="APID", ctid="CTID"),
+        DecodeCountingDLTMessage(apid="DLTD", ctid="INTM", payload="ApplicationID 'DBSY' registered"),
+        DecodeCountingDLTMessage(apid="DA1", ctid="DC1", payload="[connection_info ok] connected "),
+    ]
+
+    with fake_analyser_with_run_analyse_mock(dlt_msgs, plugin) as (analyser, _):
+        analyser.run_analyse(["/tmp/no-such-file"], MagicMock(), False, False)
+
+        assert [msg.decode_count for msg in dlt_msgs] == [0, 1, 1]
+
+
+def test_run_analyse_lifecycle_start_filter():
+    """Test to add the filter for lifecycle start messages when messages are filtered"""
+    with fake_analyser_with_run_analyse_mock([]) as (analyser, _):
+        with patch.object(analyser, "get_filters", return_value=[("APID", "CTID")]), patch(
+            "dltlyse.core.analyser.dlt.load", return_value=[]
+        ) as mock_load:
+            analyser.run_analyse(["/tmp/no-such-file"], MagicMock(), False, False)
+
+            assert mock_load.call_args[1]["filters"] == [("APID", "CTID"), (b"DLTD", b"INTM")]
+
+
 def test_run_analyse_buffer_traces():
     """Test to append traces to buffer"""
     dlt_msgs = [
@@ -317,6 +568,100 @@ def test_run_analyse_buffer_traces():
         mocks["process_buffer"].assert_called()
 
 
+@pytest.mark.parametrize(
+    "traces,is_live,jobs,mergeable,parallel",
+    [
+        (["a.dlt", "b.dlt"], False, 2, True, True),
+        (["a.dlt", "b.dlt"], False, 1, True, False),
+        (["a.dlt", "b.dlt"], False, 2, False, False),
+        (["a.dlt", "b.dlt"], True, 2, True, False),
+        (["a.dlt"], False, 2, True, False),
+    ],
+)
+def test_run_analyse_parallel(traces, is_live, jobs, mergeable, parallel):
+    """Test to analyse trace files in parallel only when it is possible"""
+    plugin = FakePlugin("fake_plugin", "all")
+    plugin.mergeable = mergeable
+
+    with patch.multiple(
+        DLTAnalyser, analyse_traces=DEFAULT, analyse_traces_parallel=DEFAULT, generate_reports=DEFAULT
+    ) as mocks, fake_analyser() as analyser:
+        analyser.plugins = [plugin]
+        analyser.run_analyse(traces, MagicMock(), True, is_live, jobs=jobs)
+
+        assert mocks["analyse_traces_parallel"].called is parallel
+        assert mocks["analyse_traces"].called is not parallel
+
+
+@pytest.mark.parametrize(
+    "traces,is_live,expected_warning",
+    [
+        (["a.dlt", "b.dlt"], True, "Ignoring 2 jobs, a live run is analysed in one process"),
+        (["a.dlt"], False, "Ignoring 2 jobs, only one trace file is analysed"),
+        (
+            ["a.dlt", "b.dlt"],
+            False,
+            "Analysing the trace files one after another, these plugins are not mergeable: fake_plugin",
+        ),
+    ],
+)
+def test_run_analyse_parallel_ignored_warning(caplog, traces, is_live, expected_warning):
+    """Test to warn why the trace files are analysed one after another when several jobs are requested"""
+    mergeable_plugin = FakePlugin("mergeable_plugin", "all")
+    mergeable_plugin.mergeable = True
+    plugin = FakePlugin("fake_plugin", "all")
+    plugin.mergeable = False
+
+    with patch.multiple(
+        DLTAnalyser, analyse_traces=DEFAULT, analyse_traces_parallel=DEFAULT, generate_reports=DEFAULT
+    ), fake_analyser() as analyser:
+        analyser.plugins = [mergeable_plugin, plugin]
+        analyser.run_analyse(traces, MagicMock(), True, is_live, jobs=2)
+
+    assert [record.getMessage() for record in caplog.records if record.levelno == logging.WARNING] == [
+        expected_warning
+    ]
+
+
+def test_analyse_traces_parallel_lifecycle_offset():
+    """Test to offset the lifecycle ids of each trace file by the lifecycles of the previous trace files"""
+    plugin = MagicMock()
+    other_plugins = [MagicMock(), MagicMock()]
+    results = {
+        "a.dlt": ([other_plugins[0]], {}, 2),
+        "b.dlt": ([other_plugins[1]], {"b.dlt": "Error Loading File"}, 3),
+    }
+
+    with patch("concurrent.futures.ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor), patch(
+        "dltlyse.core.analyser._analyse_trace_file", side_effect=lambda analyser, filename, no_sort: results[filename]
+    ):
+        with fake_analyser() as analyser:
+            analyser.plugins = [plugin]
+            analyser.analyse_traces_parallel(["a.dlt", "b.dlt"], False, 2)
+
+            assert plugin.merge.call_args_list == [call(other_plugins[0], 0), call(other_plugins[1], 2)]
+            assert analyser.file_exceptions == {"b.dlt": "Error Loading File"}
+            assert analyser.last_lifecycle_id == 5
+
+
+def test_analyse_traces_parallel_processes():
+    """Test to analyse two trace files in worker processes and merge the plugin states"""
+    file1 = create_temp_dlt_file(stream=b"".join([start_dlt_message, single_random_dlt_message, start_dlt_message]))
+    file2 = create_temp_dlt_file(
+        stream=b"".join([start_dlt_message, single_random_dlt_message, start_dlt_message, start_dlt_message])
+    )
+
+    with fake_analyser() as analyser:
+        plugin = ContextPlugin()
+        analyser.plugins = [plugin]
+        analyser.plugin_collector.init_plugins(analyser.plugins)
+        analyser.analyse_traces_parallel([file1, file2], False, 2)
+
+        assert plugin.matched_messages == 5
+        assert analyser.last_lifecycle_id == 5
+        assert not analyser.file_exceptions
+
+
 def test_plugin_collector_convert_dict_value_tuple():
     """Test to convert a list of plugins to a tuple of plugins"""
     collector = DltlysePluginCollector()
@@ -342,6 +687,24 @@ def test_plugin_collector_dispatch():
     assert collector.greedy_plugins == (test_plugins["greedy"],)
 
 
+def test_plugin_collector_lookup_plugins():
+    """Test to look up and cache the plugins for a (apid, ctid) pair"""
+    test_plugins = {
+        "greedy": FakePlugin("greedy", "all"),
+        "apid_ctid": FakePlugin("apid_ctid", [("APID", "CTID")]),
+        "apid": FakePlugin("apid", [("APID", "")]),
+        "ctid": FakePlugin("ctid", [("", "CTID")]),
+    }
+
+    collector = DltlysePluginCollector()
+    collector._dispatch_plugins(test_plugins.values())  # pylint: disable=protected-access
+
+    expected = (test_plugins["apid_ctid"], test_plugins["apid"], test_plugins["ctid"], test_plugins["greedy"])
+    assert collector.lookup_plugins(("APID", "CTID")) == expected
+    assert collector.dispatch_cache == {("APID", "CTID"): expected}
+    assert collector.lookup_plugins(("OTHER", "OTHER")) == (test_plugins["greedy"],)
+
+
 @pytest.mark.parametrize(
     "plugins,expected_msg",
     [
@@ -380,7 +743,7 @@ def test_check_plugin_collector_convert_plugin_obj_to_name(plugins, expected_val
 
 def test_plugin_collector_print_plugin_collections():
     """Test to print the plugin dispatching information"""
-    with patch("dltlyse.core.analyser.DltlysePluginCollector._convert_plugin_obj_to_name") as mock_convert:
+    with patch.object(DltlysePluginCollector, "_convert_plugin_obj_to_name") as mock_convert:
         DltlysePluginCollector()._print_plugin_collections()  # pylint: disable=protected-access
 
         assert mock_convert.call_count == 4
@@ -388,10 +751,9 @@ def test_plugin_collector_print_plugin_collections():
 
 def test_plugin_collector_init_plugins():
     """Test to init plugin dispatching information"""
-    cls_name = "dltlyse.core.analyser.DltlysePluginCollector"
-    with patch("{}._check_plugin_msg_filters".format(cls_name)) as mock_check, patch(
-        "{}._dispatch_plugins".format(cls_name)
-    ) as mock_dispatch, patch("{}._print_plugin_collections".format(cls_name)) as mock_print:
+    with patch.object(DltlysePluginCollector, "_check_plugin_msg_filters") as mock_check, patch.object(
+        DltlysePluginCollector, "_dispatch_plugins"
+    ) as mock_dispatch, patch.object(DltlysePluginCollector, "_print_plugin_collections") as mock_print:
         DltlysePluginCollector().init_plugins([])
 
         mock_check.assert_called_with([])
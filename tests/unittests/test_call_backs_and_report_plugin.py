@@ -231,3 +231,41 @@ class TestCallBacksAndReportPlugin(TestCallBacksAndReportPluginBase):
         self.assertEqual(matches[0], systemd_message)
         self.assertEqual(matches[1], main_message)
         self.assertEqual(matches[2], mtee_message)
+
+    def test_class_callbacks(self):
+        """Tests that the callbacks defined in the class and its bases are registered."""
+
+        class BasePlugin(CallBacksAndReportPluginForTesting):
+            """Defines the callbacks which are inherited."""
+
+            @dlt_callback("SYS", "JOUR")
+            def systemd_callback(self, message):
+                """Inherited callback."""
+
+            @dlt_callback("LTM", "MAIN")
+            def version_callback(self, message):
+                """Callback which is overridden without decoration."""
+
+        class DerivedPlugin(BasePlugin):
+            """Overrides a callback of the base class."""
+
+            def version_callback(self, message):
+                """Not a callback anymore."""
+
+        self.assertEqual(BasePlugin.get_callback_names(), ["systemd_callback", "version_callback"])
+        plugin = DerivedPlugin()
+        self.assertEqual(DerivedPlugin.get_callback_names(), ["systemd_callback"])
+        self.assertEqual(list(plugin.dlt_callbacks), [("SYS", "JOUR")])
+        self.assertEqual(plugin.dlt_callbacks[("SYS", "JOUR")], [plugin.systemd_callback])
+
+    def test_calling_unmatched_message(self):
+        """Tests that a message without callbacks doesn't register its filter."""
+
+        @dlt_callback("LTM", "MAIN")
+        def version_callback(self, message):  # pylint: disable=unused-argument
+            """Callback for the version message."""
+
+        self.init_and_add_callbacks(version_callback)
+        self.plugin(MockDLTMessage(apid="DA1", ctid="DC1", payload="New lifecycle!"))
+
+        self.assertEqual(list(self.plugin.dlt_callbacks), [("LTM", "MAIN")])
@@ -0,0 +1,67 @@
+# Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
+"""Tests for the ExtractFiles plugin of dltlyse."""
+import os
+
+from dltlyse.mock_dlt_message import MockDLTMessage
+from dltlyse.plugins.extract_files import ExtractFilesPlugin, FULL_EXTRACT_DIR
+
+
+def file_transfer_msgs(transfer_id, filename, chunks):
+    """Helper function to create the messages of a file transfer"""
+    msgs = [MockDLTMessage(apid="SYS", ctid="FILE", payload=[b"FLST", transfer_id, filename, 0, "", b"FLST"])]
+    for index, chunk in enumerate(chunks, start=1):
+        msgs.append(MockDLTMessage(apid="SYS", ctid="FILE", payload=[b"FLDA", transfer_id, index, chunk, b"FLDA"]))
+    msgs.append(MockDLTMessage(apid="SYS", ctid="FILE", payload=[b"FLFI", transfer_id, b"FLFI"]))
+
+    return msgs
+
+
+def test_extract_file(tmp_path, monkeypatch):
+    """Test to extract a file transferred in the trace"""
+    monkeypatch.chdir(tmp_path)
+    plugin = ExtractFilesPlugin()
+    for msg in file_transfer_msgs(1, b"/var/core.gz", [b"first ", b"second"]):
+        plugin(msg)
+    plugin.report()
+
+    with open(os.path.join(FULL_EXTRACT_DIR, "core.gz"), "rb") as extracted_file:
+        assert extracted_file.read() == b"first second"
+    assert plugin.get_results()[0].state == "success"
+
+
+def test_extract_file_missing_part(tmp_path, monkeypatch):
+    """Test to report an error when a part of the file is missing"""
+    monkeypatch.chdir(tmp_path)
+    plugin = ExtractFilesPlugin()
+    msgs = file_transfer_msgs(1, b"core.gz", [b"first ", b"second", b"third"])
+    del msgs[2]
+    for msg in msgs:
+        plugin(msg)
+    plugin.report()
+
+    assert plugin.get_results()[0].state == "error"
+
+
+def test_extract_files_per_instance(tmp_path, monkeypatch):
+    """Test that a new plugin instance doesn't report the files of a previous one"""
+    monkeypatch.chdir(tmp_path)
+    plugin = ExtractFilesPlugin()
+    for msg in file_transfer_msgs(1, b"core.gz", [b"first"]):
+        plugin(msg)
+
+    assert not ExtractFilesPlugin().extracted_files
+
+
+def test_extract_file_retransferred(tmp_path, monkeypatch):
+    """Test to accept an incomplete file transfer when another transfer of the file succeeded"""
+    monkeypatch.chdir(tmp_path)
+    plugin = ExtractFilesPlugin()
+    msgs = file_transfer_msgs(1, b"core.gz", [b"first"])[:-1] + file_transfer_msgs(2, b"core.gz", [b"first"])
+    for msg in msgs:
+        plugin(msg)
+    plugin.report()
+
+    result = plugin.get_results()[0]
+    assert result.state == "success"
+    assert result.stdout == "extracted files found:\n - core.gz\n - core.gz\n"
+    assert result.attach == [os.path.join("Coredumps", "core.gz")]
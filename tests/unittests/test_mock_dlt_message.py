@@ -0,0 +1,19 @@
+# Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
+"""Tests for the mock DLT message of dltlyse."""
+import pytest
+
+from dltlyse.mock_dlt_message import MockDLTMessage
+
+
+@pytest.mark.parametrize(
+    "target, expected",
+    [
+        ({"apid": "SYS", "ctid": "JOUR"}, True),
+        ({"apid": "SYS", "ctid": "FILE"}, False),
+        ({}, True),
+        ({"unknown": None}, False),
+    ],
+)
+def test_compare(target, expected):
+    """Test to compare a message to a dictionary of attributes"""
+    assert MockDLTMessage(apid="SYS", ctid="JOUR").compare(target) is expected
@@ -2,10 +2,13 @@
 """Test plugin_metadata decorator and xunit report functions"""
 import datetime as dt
 import inspect
+import io
 import socket
 from unittest.mock import patch, mock_open
 import xml.etree.ElementTree as etree
 
+import pytest
+
 from dltlyse.core.plugin_base import Plugin, plugin_metadata
 from dltlyse.core.report import logger, Metadata, Result, XUnitReport
 
@@ -15,22 +18,24 @@ def _equal_xml_tree(root, other):  # pylint: disable=too-many-return-statements
     if root is None or other is None:
         return False
 
-    if root.tag != other.tag:
-        return False
+    stack = [(root, other)]
+    while stack:
+        root, other = stack.pop()
 
-    if root.text and other.text and root.text != other.text:
-        return False
+        if root.tag != other.tag:
+            return False
 
-    if len(tuple(root)) != len(tuple(other)):
-        return False
+        if len(root) != len(other):
+            return False
 
-    if dict(root.attrib) != dict(other.attrib):
-        return False
+        if root.attrib != other.attrib:
+            return False
 
-    for root_child, other_child in zip(root, other):
-        if not _equal_xml_tree(root_child, other_child):
+        if root.text and other.text and root.text != other.text:
             return False
 
+        stack.extend(zip(root, other))
+
     return True
 
 
@@ -77,6 +82,11 @@ class TestPlugin(TestNoMetadataPlugin):
     """
 
 
+@plugin_metadata(type="test", limits={"cpu": 80})
+class TestNestedMetadataPlugin(TestNoMetadataPlugin):
+    """Test-for-nested-metadata"""
+
+
 def generate_test_result(attach=None, extra=""):
     """Prepare test result data and xml string"""
     attach = attach or []
@@ -166,6 +176,51 @@ def test_plugin_add_result():
     }
 
 
+def test_plugin_add_results_own_metadata():  # pylint: disable=invalid-name
+    """Tests that every result gets its own metadata dict."""
+    plugin = TestPlugin()
+    plugin.add_result(state="success", message="first")
+    plugin.add_result(state="success", message="second")
+
+    first, second = plugin.get_results()
+    first.metadata.metadata["extra"] = "extra"
+    assert "extra" not in second.metadata.metadata
+    assert "extra" not in TestPlugin.plugin_metadata
+
+
+def test_plugin_add_results_own_nested_metadata():  # pylint: disable=invalid-name
+    """Tests that the nested metadata values of a result are not shared with other results."""
+    plugin = TestNestedMetadataPlugin()
+    plugin.add_result(state="success", message="first")
+    plugin.add_result(state="success", message="second")
+
+    first, second = plugin.get_results()
+    first.metadata.metadata["limits"]["cpu"] = 90
+    assert second.metadata.metadata["limits"] == {"cpu": 80}
+    assert TestNestedMetadataPlugin.plugin_metadata["limits"] == {"cpu": 80}
+
+
+def test_plugin_merge():
+    """Tests that the results, exceptions and timings of another plugin object are merged."""
+    plugin = TestPlugin()
+    plugin.add_result(message="first")
+    plugin.add_exception("exception")
+    plugin.add_timing("calling", 1.0)
+
+    other = TestPlugin()
+    other.add_result(message="second")
+    other.add_exception("exception")
+    other.add_exception("other exception")
+    other.add_timing("calling", 2.0)
+
+    plugin.merge(other)
+
+    assert [result.message for result in plugin.get_results()] == ["first", "second"]
+    assert not plugin.report_exceptions()
+    assert plugin.get_results()[-1].stdout == "exception\n-------------\nother exception"
+    assert plugin._Plugin__timings == {"calling": 3.0}  # pylint: disable=protected-access
+
+
 def test_metadata_render_default():
     """Tests that metadata xml is None by default"""
     meta = Metadata()
@@ -250,29 +305,17 @@ def test_result_render_xml_fail():
     )
 
 
-def test_result_render_xml_success():
-    """Tests that result is rendered when the state is success."""
-    result, excepted = generate_test_result()
-    assert equal_xml_tree(result.render_xml(), excepted)
-
-
-def test_result_render_xml_with_metadata():  # pylint: disable=invalid-name
-    """Tests that result is rendered with metadata"""
-    result, excepted = generate_test_result(extra="<metadata/>")
-
-    with patch("dltlyse.core.report.Metadata.render_xml", return_value=etree.Element("metadata")):
-        assert equal_xml_tree(result.render_xml(), excepted)
-
-
-def test_result_render_xml_with_attachment():  # pylint: disable=invalid-name
-    """Tests that result is rendered with attachment"""
-    result, excepted = generate_test_result(attach=["test.csv"])
+@pytest.mark.parametrize("attach", [None, ["test.csv"]])
+def test_result_render_xml_success(attach):
+    """Tests that result is rendered when the state is success, with and without attachment"""
+    result, excepted = generate_test_result(attach=attach)
     assert equal_xml_tree(result.render_xml(), excepted)
 
 
-def test_result_render_xml_with_metadata_and_attachment():  # pylint: disable=invalid-name
-    """Tests that result is rendered with metadata and attachment"""
-    result, excepted = generate_test_result(attach=["test.csv"], extra="<metadata/>")
+@pytest.mark.parametrize("attach", [None, ["test.csv"]])
+def test_result_render_xml_with_metadata(attach):  # pylint: disable=invalid-name
+    """Tests that result is rendered with metadata, with and without attachment"""
+    result, excepted = generate_test_result(attach=attach, extra="<metadata/>")
 
     with patch("dltlyse.core.report.Metadata.render_xml", return_value=etree.Element("metadata")):
         assert equal_xml_tree(result.render_xml(), excepted)
@@ -306,6 +349,17 @@ def test_xunit_report_render_xml():
         )
 
 
+def render_xunit_report(xunit_report):
+    """Render the xunit report to a mocked file and return the written XML"""
+    written = io.BytesIO()
+    mocked_file = mock_open()
+    mocked_file.return_value.write.side_effect = written.write
+    with patch("dltlyse.core.report.open", mocked_file):
+        xunit_report.render()
+
+    return written.getvalue().decode()
+
+
 def test_xunit_report_not_render():
     """Tests that xunit report is not written with an invalid filename."""
     xunit_report = XUnitReport()
@@ -318,17 +372,27 @@ def test_xunit_report_not_render():
 
 def test_xunit_report_render():
     """Tests that xunit report is written to file correctly."""
-    xunit_report = XUnitReport()
+    xunit_report = XUnitReport(hostname="test1")
     xunit_report.outfile = "mocked-file"
+    xunit_report.add_results([Result(), Result()])
 
-    with patch("dltlyse.core.report.XUnitReport.render_xml", return_value=etree.Element("testsuite")):
-        with patch("dltlyse.core.report.open", mock_open()) as mocked_file:
-            xunit_report.render()
+    with patch("dltlyse.core.report.Result.render_xml", side_effect=[etree.Element("testcase"), Exception]):
+        assert render_xunit_report(xunit_report) == (
+            "<?xml version='1.0' encoding='UTF-8'?>\n"
+            '<testsuite name="dltlyse" tests="2" errors="0" failures="0" skip="0" hostname="test1">'
+            "<testcase /></testsuite>"
+        )
 
-            assert mocked_file().write.call_count >= 1
 
-            write_xml = "".join(args[0].decode() for args, _ in mocked_file().write.call_args_list)
-            assert write_xml == "<?xml version='1.0' encoding='UTF-8'?>\n<testsuite />"
+def test_xunit_report_render_empty():
+    """Tests that xunit report without results is written to file correctly."""
+    xunit_report = XUnitReport(hostname="test1")
+    xunit_report.outfile = "mocked-file"
+
+    assert render_xunit_report(xunit_report) == (
+        "<?xml version='1.0' encoding='UTF-8'?>\n"
+        '<testsuite name="dltlyse" tests="0" errors="0" failures="0" skip="0" hostname="test1"></testsuite>'
+    )
 
 
 def test_xunit_report_check_software_hardware():
@@ -338,17 +402,13 @@ def test_xunit_report_check_software_hardware():
     )
     xunit_report.outfile = "mocked-file"
 
-    with patch("dltlyse.core.report.open", mock_open()) as mocked_file:
-        xunit_report.render()
-
-        write_xml = "".join(args[0].decode() for args, _ in mocked_file().write.call_args_list)
-        print(write_xml)
-        check_params = (
-            '<hardware CPU="Intel 486DX2-66" RAM="8Mb" />',
-            '<software OS="Windows NT 3.5 Daytona" />',
-        )
-        for param in check_params:
-            assert param in write_xml
+    write_xml = render_xunit_report(xunit_report)
+    check_params = (
+        '<hardware CPU="Intel 486DX2-66" RAM="8Mb" />',
+        '<software OS="Windows NT 3.5 Daytona" />',
+    )
+    for param in check_params:
+        assert param in write_xml
 
 
 def test_xunit_report_check_testsuite_params():
@@ -356,11 +416,7 @@ def test_xunit_report_check_testsuite_params():
     xunit_report = XUnitReport(package="package.gz", id_="some_strange_id", hostname="test1")
     xunit_report.outfile = "mocked-file"
 
-    with patch("dltlyse.core.report.open", mock_open()) as mocked_file:
-        xunit_report.render()
-
-        write_xml = "".join(args[0].decode() for args, _ in mocked_file().write.call_args_list)
-
-        check_params = ('package="package.gz"', 'id="some_strange_id"', 'hostname="test1"')
-        for param in check_params:
-            assert param in write_xml
+    write_xml = render_xunit_report(xunit_report)
+    check_params = ('package="package.gz"', 'id="some_strange_id"', 'hostname="test1"')
+    for param in check_params:
+        assert param in write_xml
@@ -2,7 +2,7 @@
 """Tests for data_to_xml_string plugin for dltlyse."""
 from unittest import TestCase
 
-from dltlyse.core.utils import data_to_xml_string
+from dltlyse.core.utils import data_to_xml_string, data_to_xml_tree
 
 
 class TestDataToXMLString(TestCase):
@@ -158,3 +158,17 @@ class TestDataToXMLString(TestCase):
 </foo>
 """,
         )
+
+    def test_deeply_nested_children(self):
+        """Tests that nesting deeper than the recursion limit is converted."""
+        data = "leaf"
+        for _ in range(2000):
+            data = "node", [data]
+
+        node = data_to_xml_tree(data)
+        depth = 0
+        while len(node):
+            node = node[0]
+            depth += 1
+        self.assertEqual(depth, 2000)
+        self.assertEqual(node.tag, "leaf")
@@ -0,0 +1,33 @@
+# Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
+"""Tests for the command line interface of dltlyse."""
+import os
+
+import pytest
+
+from dltlyse.run_dltlyse import find_traces
+
+
+@pytest.fixture
+def trace_dir(tmp_path):
+    """Directory with trace files, other files and a subdirectory with a trace file"""
+    for name in ["b.dlt", "a.dlt", "notes.txt", "sub/c.dlt", "sub/d.dlt.txt"]:
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"")
+    (tmp_path / "dir.dlt").mkdir()
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "recursive,expected_traces",
+    [
+        (False, ["a.dlt", "b.dlt"]),
+        (True, ["a.dlt", "b.dlt", os.path.join("sub", "c.dlt")]),
+    ],
+)
+def test_find_traces(trace_dir, recursive, expected_traces):
+    """Test to find the trace files in a directory"""
+    traces = find_traces(str(trace_dir), recursive=recursive)
+
+    assert traces == [os.path.join(str(trace_dir), trace) for trace in expected_traces]
@@ -0,0 +1,54 @@
+# Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
+"""Tests for the SysError plugin of dltlyse."""
+from dltlyse.mock_dlt_message import MockDLTMessage
+from dltlyse.plugins import sys_errors
+
+
+def test_sys_errors_shared_library():
+    """Test to report programs which could not load shared libraries"""
+    plugin = sys_errors.TestSysErrorPlugin()
+    plugin(MockDLTMessage(apid="SYS", ctid="JOUR", payload="systemd[1]: Started Journal Service."))
+    plugin(
+        MockDLTMessage(
+            apid="SYS",
+            ctid="JOUR",
+            payload="app[42]: /usr/bin/app: error while loading shared libraries: libfoo.so.1: "
+            "cannot open shared object file: No such file or directory",
+        )
+    )
+    plugin.report()
+
+    result = plugin.get_results()[0]
+    assert result.state == "failure"
+    assert result.stdout == "error while loading shared libraries:\n/usr/bin/app faild to load libfoo.so.1"
+
+
+def test_sys_errors_no_errors():
+    """Test to report success when no errors were found"""
+    plugin = sys_errors.TestSysErrorPlugin()
+    plugin(MockDLTMessage(apid="SYS", ctid="JOUR", payload="systemd[1]: Started Journal Service."))
+    plugin.report()
+
+    assert plugin.get_results()[0].state == "success"
+
+
+def test_sys_errors_merge():
+    """Test to merge the errors found by another analyser process"""
+    payload = (
+        "app[42]: /usr/bin/{}: error while loading shared libraries: libfoo.so.1: "
+        "cannot open shared object file: No such file or directory"
+    )
+    plugin = sys_errors.TestSysErrorPlugin()
+    plugin(MockDLTMessage(apid="SYS", ctid="JOUR", payload=payload.format("app")))
+    other = sys_errors.TestSysErrorPlugin()
+    other(MockDLTMessage(apid="SYS", ctid="JOUR", payload=payload.format("app")))
+    other(MockDLTMessage(apid="SYS", ctid="JOUR", payload=payload.format("tool")))
+
+    plugin.merge(other)
+
+    assert plugin.errors == {
+        "error while loading shared libraries": {
+            "/usr/bin/app faild to load libfoo.so.1",
+            "/usr/bin/tool faild to load libfoo.so.1",
+        }
+    }
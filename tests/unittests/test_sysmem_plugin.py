@@ -0,0 +1,30 @@
+# Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
+"""Tests for the Sysmem plugin of dltlyse."""
+import csv
+
+from dltlyse.mock_dlt_message import MockDLTMessage
+from dltlyse.plugins.sysmem_plugin import SysmemPlugin
+
+MEMS_PAYLOAD = (
+    "MemTotal: 3845.12MB MemFree: 1024.00MB MemAvailable: 2048.50MB Buffers: 12.00MB "
+    "Cached: 512.25MB SwapCached: 1.00MB Shmem: 8.00MB"
+)
+
+
+def test_sysmem_row(tmp_path, monkeypatch):
+    """Test that the memory statistics of a message are written to the report"""
+    monkeypatch.chdir(tmp_path)
+    plugin = SysmemPlugin()
+    plugin.new_lifecycle("MGHS", 1)
+    plugin(MockDLTMessage(apid="MON", ctid="MEMS", payload=MEMS_PAYLOAD, tmsp=1.5))
+    plugin.end_lifecycle("MGHS", 1)
+    plugin.report()
+
+    with open(SysmemPlugin.pathname, newline="") as report_file:
+        rows = list(csv.reader(report_file))
+    assert rows == [
+        list(SysmemPlugin.lifecycle_csv_fields),
+        ["1", "1.5", "3937402", "2097664", "12288", "524544", "8192"],
+    ]
+    assert plugin.min_mem_available == 2097664
+    assert [result.state for result in plugin.get_results()] == ["success"]
@@ -0,0 +1,24 @@
+# Copyright (C) 2022. BMW Car IT GmbH. All rights reserved.
+"""Tests for the utilities of dltlyse."""
+import pytest
+
+from dltlyse.core.utils import seconds_to_human_readable
+
+
+@pytest.mark.parametrize(
+    "seconds, result",
+    [
+        (0.01, "0:00:00.01"),
+        (0.5, "0:00:00.50"),
+        (1, "0:00:01.00"),
+        (59.99, "0:00:59.99"),
+        (60, "0:01:00.00"),
+        (61.25, "0:01:01.25"),
+        (3599, "0:59:59.00"),
+        (3600, "1:00:00.00"),
+        (86461.5, "24:01:01.50"),
+    ],
+)
+def test_seconds_to_human_readable(seconds, result):
+    """Test to split seconds into hours, minutes, seconds and hundredths"""
+    assert seconds_to_human_readable(seconds) == result